@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Optional, Dict, Any
@@ -65,6 +66,15 @@ class AbstractRecorder(ABC):
         """
         pass
 
+    async def async_wait_for_completion(self) -> None:
+        """
+        @brief Await the completion of the recording.
+
+        The default runs wait_for_completion() in a worker thread. Recorders that
+        can be notified by the event loop override this to avoid the thread.
+        """
+        await asyncio.to_thread(self.wait_for_completion)
+
     @property
     def is_recording(self) -> bool:
         """
@@ -113,20 +113,21 @@ class TmuxAsciinemaRecorder(AbstractRecorder):
         @brief Wait for the tmux session to complete.
 
         For tmux sessions, completion means the tmux session has terminated.
-        This is a blocking call.
+        This is a blocking call: it waits on the asciinema process, and only
+        polls tmux if the client detached while the session kept running.
         """
         if self._is_recording:
+            self.asciinema_recorder.wait()
             self.tmux_manager.wait_for_exit()
 
     def _cleanup_tmux(self) -> None:
         """
         @brief Stop all processes and clean up resources.
 
-        This method is called via atexit to ensure resources
-        are released even if the program exits unexpectedly.
+        Called from stop_recording once the recording has ended.
         """
         try:
-            if self.tmux_manager.session_exists():
-                self.tmux_manager.terminate_session()
+            # terminate_session checks for the session itself
+            self.tmux_manager.terminate_session()
         except Exception as e:
             print(f"Warning: Could not terminate tmux session: {e}")
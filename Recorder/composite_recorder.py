@@ -1,12 +1,53 @@
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-import time
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Callable, Type, Set, Iterator
+from contextlib import contextmanager, redirect_stdout, ExitStack
+import asyncio
+import io
+import sys
 from Recorder.ab_recorder import AbstractRecorder
+from Recorder.asciinema_recorder import TmuxAsciinemaRecorder
 from Reporter.ab_reporter import AbstractReporter
 from Reporter.tmux_asciinema_reporter import TmuxSessionReporter
 from Reporter.video_reporter import VideoReporter
-from Recorder.asciinema_recorder import TmuxAsciinemaRecorder
-from Recorder.video_recorder import VideoRecorder
+
+if TYPE_CHECKING:
+    # The video recorder module is only loaded when video recording is actually requested
+    from Recorder.video_recorder import VideoRecorder
+
+_VIDEO_RECORDER_MODULE = "Recorder.video_recorder"
+
+
+def _recorder_role(recorder: AbstractRecorder) -> Optional[str]:
+    """
+    @brief Find the fixed role a recorder plays in the start/stop sequence.
+
+    Subclasses share the role of their base recorder. A VideoRecorder can only
+    exist once its module has been imported, so the module is looked up in
+    sys.modules rather than imported here.
+
+    @param recorder Recorder to classify.
+    @return Role name, or None for recorders without a fixed role.
+    """
+    if isinstance(recorder, TmuxAsciinemaRecorder):
+        return "TmuxAsciinemaRecorder"
+    video_module = sys.modules.get(_VIDEO_RECORDER_MODULE)
+    if video_module is not None and isinstance(recorder, video_module.VideoRecorder):
+        return "VideoRecorder"
+    return None
+
+
+@contextmanager
+def _buffered_stdout() -> Iterator[None]:
+    """
+    @brief Collect everything printed inside the block and emit it in one write.
+    """
+    buffer = io.StringIO()
+    try:
+        with redirect_stdout(buffer):
+            yield
+    finally:
+        sys.stdout.write(buffer.getvalue())
+        sys.stdout.flush()
 
 
 class CompositeRecorder(AbstractRecorder):
@@ -25,10 +66,27 @@ class CompositeRecorder(AbstractRecorder):
         @param project_name Name of the project being recorded.
         @param recorders List of recorder instances to be managed.
         """
-        self.recorders: List[AbstractRecorder] = recorders or []
+        self.recorders: List[AbstractRecorder] = []
+        # Class names, roles and reporters are resolved once per registration
+        self._recorder_types: List[str] = []
+        self._recorder_ids: Set[int] = set()
+        self._reporters: Dict[int, Optional[AbstractReporter]] = {}
+        self._reporters_by_typename: Dict[str, AbstractReporter] = {}
+        # Reporter class per recorder role
+        self._reporter_factory: Dict[str, Type[AbstractReporter]] = {
+            "TmuxAsciinemaRecorder": TmuxSessionReporter,
+            "VideoRecorder": VideoReporter,
+        }
         self._is_recording=False
-        self._tmux_recorder = None
-        self._video_recorder = None
+        # Start messages held back while the tmux session owns the terminal
+        self._deferred_messages: List[str] = []
+        # Results of recorders already stopped while waiting for completion, by recorder id
+        self._finished_results: Dict[int, Any] = {}
+        # Recorders whose start/stop order matters, keyed by their role
+        self._role_slots: Dict[str, AbstractRecorder] = {}
+
+        for recorder in recorders or []:
+            self.add_recorder(recorder)
 
     def add_recorder(self, recorder: AbstractRecorder) -> None:
         """
@@ -36,12 +94,19 @@ class CompositeRecorder(AbstractRecorder):
 
         @param recorder The recorder instance to add.
         """
-        if recorder not in self.recorders:
+        if id(recorder) not in self._recorder_ids:
+            self._recorder_ids.add(id(recorder))
             self.recorders.append(recorder)
-            if isinstance(recorder, TmuxAsciinemaRecorder):
-                self._tmux_recorder = recorder
-            elif isinstance(recorder, VideoRecorder):
-                self._video_recorder = recorder
+            recorder_type = type(recorder).__name__
+            self._recorder_types.append(recorder_type)
+            role = _recorder_role(recorder)
+            reporter_cls = self._reporter_factory.get(role)
+            reporter = reporter_cls() if reporter_cls else None
+            self._reporters[id(recorder)] = reporter
+            if reporter:
+                self._reporters_by_typename[recorder_type] = reporter
+            if role:
+                self._role_slots[role] = recorder
 
 
     def remove_recorder(self, recorder: AbstractRecorder) -> None:
@@ -50,51 +115,112 @@ class CompositeRecorder(AbstractRecorder):
 
         @param recorder The recorder instance to remove.
         """
-        if recorder in self.recorders:
-            self.recorders.remove(recorder)
-            if self._tmux_recorder == recorder:
-                self._tmux_recorder = None
-            elif self._video_recorder == recorder:
-                self._video_recorder = None
+        if id(recorder) in self._recorder_ids:
+            self._recorder_ids.discard(id(recorder))
+            index = self.recorders.index(recorder)
+            del self.recorders[index]
+            del self._recorder_types[index]
+            reporter = self._reporters.pop(id(recorder), None)
+            if reporter and self._reporters_by_typename.get(type(recorder).__name__) is reporter:
+                del self._reporters_by_typename[type(recorder).__name__]
+            role = _recorder_role(recorder)
+            if role and self._role_slots.get(role) is recorder:
+                self._role_slots.pop(role)
 
     def setup(self) -> None:
         """
         @brief Set up all managed recorders.
         """
-        for recorder in self.recorders:
-            recorder.setup()
+        asyncio.run(self.async_setup())
+
+    async def async_setup(self) -> None:
+        """
+        @brief Set up all managed recorders concurrently.
+        """
+        await self._gather(lambda recorder: recorder.setup(), self.recorders)
 
     def start_recording(self) -> None:
         """
         @brief Start recording on all managed recorders.
         """
+        asyncio.run(self.async_start_recording())
+
+    async def async_start_recording(self) -> None:
+        """
+        @brief Start recording on all managed recorders.
+
+        The video recorder is started first, then the tmux recorder, then any
+        remaining recorders concurrently. If a later step fails, recorders that were already started
+        are stopped again.
+
+        Once tmux is starting, the session takes over the terminal, so messages
+        about the start are held back and printed after the recording ends.
+        """
         if self._is_recording:
             print("Recording is already in progress")
             return
 
         self._is_recording = True
 
-        # pre-hook
-        if self._video_recorder:
-            self._video_recorder.start_recording()
-            time.sleep(1)
-            if not self._video_recorder.is_recording:
-                print("[!] Warning: Video recording may not have started properly")
+        video_recorder: Optional['VideoRecorder'] = self._role_slots.get("VideoRecorder")
+        tmux_recorder: Optional['TmuxAsciinemaRecorder'] = self._role_slots.get("TmuxAsciinemaRecorder")
+
+        with ExitStack() as rollback:
+            rollback.callback(setattr, self, "_is_recording", False)
+            rollback.callback(self._flush_deferred_messages)
+
+            # pre-hook
+            if video_recorder:
+                await asyncio.to_thread(video_recorder.start_recording)
+                rollback.callback(video_recorder.stop_recording)
+                # ffmpeg's startup grace period overlaps the tmux start
+                video_started = asyncio.create_task(
+                    asyncio.to_thread(video_recorder.wait_until_started, timeout=1.0)
+                )
 
-        # on-tmux
-        if self._tmux_recorder:
-            self._tmux_recorder.start_recording()
+            # on-tmux
+            if tmux_recorder:
+                await asyncio.to_thread(tmux_recorder.start_recording)
+                rollback.callback(tmux_recorder.stop_recording)
 
-        # after-hook
-        for recorder in self.recorders:
-            if recorder != self._video_recorder and recorder != self._tmux_recorder:
+            if video_recorder and not await video_started:
+                self._deferred_messages.append("[!] Warning: Video recording may not have started properly")
+
+            # after-hook
+            started_after_hook: List[AbstractRecorder] = []
+
+            def start_after_hook(recorder: AbstractRecorder) -> None:
                 recorder.start_recording()
-                print(f"[✓] {type(recorder).__name__} started")
+                started_after_hook.append(recorder)
+                self._deferred_messages.append(f"[✓] {type(recorder).__name__} started")
+
+            def stop_after_hook() -> None:
+                for recorder in reversed(started_after_hook):
+                    recorder.stop_recording()
+
+            rollback.callback(stop_after_hook)
+
+            after_hook_recorders = [
+                recorder for recorder in self.recorders
+                if recorder is not video_recorder and recorder is not tmux_recorder
+            ]
+            await self._gather(start_after_hook, after_hook_recorders)
+
+            # Everything started, keep the recorders running
+            rollback.pop_all()
 
     def stop_recording(self) -> Optional[Dict[str, Path]]:
         """
         @brief Stop recording on all managed recorders.
 
+        @return Dictionary mapping recorder type names to output paths.
+        """
+        return asyncio.run(self.async_stop_recording())
+
+    async def async_stop_recording(self) -> Optional[Dict[str, Path]]:
+        """
+        @brief Stop recording on all managed recorders concurrently.
+
         @return Dictionary mapping recorder type names to output paths.
         """
         if not self._is_recording:
@@ -102,23 +228,37 @@ class CompositeRecorder(AbstractRecorder):
 
         self._is_recording = False
 
-        # Stop each recorder and collect output paths
-        results = {}
-        for recorder in self.recorders:
-            # Get reporter for this recorder
-            reporter = self._get_reporter_for_recorder(recorder)
-
-            recorder_result = recorder.stop_recording()
-            # Print end message if reporter exists
-            if reporter:
-                reporter.print_recording_end()
-
-            if recorder_result:
-                # Use the class name as the key
-                recorder_type = type(recorder).__name__
-                results[recorder_type] = recorder_result
+        # Stop the remaining recorders concurrently, then report in registration order
+        finished_results, self._finished_results = self._finished_results, {}
+        pending = [recorder for recorder in self.recorders if id(recorder) not in finished_results]
+        stopped_results = iter(await self._gather(lambda recorder: recorder.stop_recording(), pending))
+        recorder_results = [
+            finished_results[id(recorder)] if id(recorder) in finished_results else next(stopped_results)
+            for recorder in self.recorders
+        ]
+
+        with _buffered_stdout():
+            self._flush_deferred_messages()
+            for recorder, recorder_result in zip(self.recorders, recorder_results):
+                # Print end message if reporter exists and the recorder produced output
+                reporter = self._get_reporter_for_recorder(recorder)
+                if reporter and recorder_result:
+                    reporter.print_recording_end()
+
+        # Use the class name as the key, skipping recorders with no output
+        return {
+            recorder_type: recorder_result
+            for recorder_type, recorder_result in zip(self._recorder_types, recorder_results)
+            if recorder_result
+        }
 
-        return results
+    def _flush_deferred_messages(self) -> None:
+        """
+        @brief Print the start messages held back while the tmux session was attached.
+        """
+        for message in self._deferred_messages:
+            print(message)
+        self._deferred_messages.clear()
 
     def get_session_info(self) -> Dict[str, Any]:
         """
@@ -126,41 +266,60 @@ class CompositeRecorder(AbstractRecorder):
 
         @return Dictionary containing combined session details.
         """
-        # Start with basic session info
-        info = {
-            "recorders": [],
+        # Recorder type list followed by the info from each recorder
+        return {
+            "recorders": list(self._recorder_types),
+            **{
+                recorder_type: recorder.get_session_info()
+                for recorder_type, recorder in zip(self._recorder_types, self.recorders)
+            },
         }
 
-        # Add info from each recorder
-        for recorder in self.recorders:
-            recorder_type = type(recorder).__name__
-            recorder_info = recorder.get_session_info()
-            info[recorder_type] = recorder_info
-            info["recorders"].append(recorder_type)
-
-        return info
-
     def wait_for_completion(self) -> None:
         """
         @brief Wait for all managed recorders to complete.
 
         Calls wait_for_completion() on all managed recorders.
         """
-        if self._tmux_recorder:
-            self._tmux_recorder.wait_for_completion()
-            if self._video_recorder and self._video_recorder.is_recording:
-                self._video_recorder.stop_recording()
+        asyncio.run(self.async_wait_for_completion())
+
+    async def async_wait_for_completion(self) -> None:
+        """
+        @brief Wait for all managed recorders to complete.
+
+        When a tmux recorder is present its session end defines completion and
+        the video recorder is stopped right after it; its result is kept for
+        stop_recording().
+        """
+        tmux_recorder: Optional['TmuxAsciinemaRecorder'] = self._role_slots.get("TmuxAsciinemaRecorder")
+        video_recorder: Optional['VideoRecorder'] = self._role_slots.get("VideoRecorder")
+
+        if tmux_recorder:
+            await tmux_recorder.async_wait_for_completion()
+            if video_recorder and video_recorder.is_recording:
+                self._finished_results[id(video_recorder)] = await asyncio.to_thread(video_recorder.stop_recording)
         else:
-            for recorder in self.recorders:
-                recorder.wait_for_completion()
+            await asyncio.gather(*(recorder.async_wait_for_completion() for recorder in self.recorders))
+
+    async def _gather(self, action: Callable[[AbstractRecorder], Any], recorders: List[AbstractRecorder]) -> List[Any]:
+        """
+        @brief Run an action on each recorder concurrently.
+
+        Each action is independent blocking I/O, so it is pushed to a worker
+        thread with asyncio.to_thread. A single recorder is handled inline.
+
+        @param action Callable invoked with each recorder.
+        @param recorders Recorders to run the action on.
+        @return Action results in recorder order.
+        @throws Exception The first exception raised by an action.
+        """
+        if len(recorders) <= 1:
+            return [action(recorder) for recorder in recorders]
+
+        return list(await asyncio.gather(*(asyncio.to_thread(action, recorder) for recorder in recorders)))
 
     def _get_reporter_for_recorder(self, recorder) -> Optional['AbstractReporter']:
-        recorder_type = type(recorder).__name__
-        if recorder_type == "TmuxAsciinemaRecorder":
-            return TmuxSessionReporter()
-        elif recorder_type == "VideoRecorder":
-            return VideoReporter()
-        return None
+        return self._reporters.get(id(recorder))
 
     def print_results(self, results: Dict[str, Dict[str, Any]], quiet: bool = False) -> None:
         """
@@ -172,12 +331,10 @@ class CompositeRecorder(AbstractRecorder):
         if quiet:
             return
 
-        for recorder in self.recorders:
-            recorder_type = type(recorder).__name__
-
-            if recorder_type in results:
-                # Get reporter for this recorder
-                reporter = self._get_reporter_for_recorder(recorder)
+        with _buffered_stdout():
+            for recorder_type, recorder_result in results.items():
+                # Get reporter for this recorder type
+                reporter = self._reporters_by_typename.get(recorder_type)
                 if reporter:
                     # Print detailed results
-                    reporter.print_recorder_results(results[recorder_type])
+                    reporter.print_recorder_results(recorder_result)
@@ -1,13 +1,298 @@
+import asyncio
+import os
+import shutil
+import signal
 import subprocess
 import threading
-from datetime import datetime
+import time
+from collections import deque
+from datetime import timedelta
+from enum import IntEnum
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Set, Tuple
 
 from Recorder.ab_recorder import AbstractRecorder
 from settingcode.app_static_config import AppStaticSettings
 from settingcode.app_session_config import AppSessionConfig
 
+# Number of trailing ffmpeg stderr lines kept for error messages
+_STDERR_TAIL_LINES = 20
+
+# ffmpeg encoder settings per quality level; live capture needs presets that keep up in real time,
+# so quality comes from the CRF ladder rather than slower presets
+_QUALITY_PRESETS = {
+    "low": ("-c:v", "libx264", "-preset", "ultrafast", "-crf", "28"),
+    "medium": ("-c:v", "libx264", "-preset", "veryfast", "-crf", "23"),
+    "high": ("-c:v", "libx264", "-preset", "faster", "-crf", "18"),
+}
+
+# Hardware H.264 encoders in order of preference, with settings per quality level
+_HW_QUALITY_PRESETS = {
+    "h264_nvenc": {
+        "low": ("-c:v", "h264_nvenc", "-preset", "p1", "-tune", "ll", "-rc", "vbr", "-cq", "32"),
+        "medium": ("-c:v", "h264_nvenc", "-preset", "p1", "-tune", "ll", "-rc", "vbr", "-cq", "24"),
+        "high": ("-c:v", "h264_nvenc", "-preset", "p1", "-tune", "ll", "-rc", "vbr", "-cq", "19"),
+    },
+    "h264_vaapi": {
+        "low": ("-c:v", "h264_vaapi", "-qp", "32"),
+        "medium": ("-c:v", "h264_vaapi", "-qp", "24"),
+        "high": ("-c:v", "h264_vaapi", "-qp", "19"),
+    },
+}
+
+# Options some hardware encoders need before the input, and the filter uploading frames to the GPU
+_HW_INPUT_OPTIONS = {"h264_vaapi": ("-vaapi_device", "/dev/dri/renderD128")}
+_HW_UPLOAD_FILTERS = {"h264_vaapi": "format=nv12,hwupload"}
+
+# ffmpeg's exit status after a SIGINT, which it handles as a graceful stop
+_FFMPEG_SIGINT_STATUS = 255
+
+# Seconds all hardware encoder test encodes together may take
+_HW_PROBE_TIMEOUT = 5.0
+
+class _State(IntEnum):
+    """
+    @brief Lifecycle of a VideoRecorder's ffmpeg process.
+
+    Only the thread driving start/stop writes the state. The SIGCHLD handler
+    never touches it; it only collects the exit status, which is_recording
+    reads from the Popen handle.
+    """
+    IDLE = 0
+    STARTING = 1
+    RUNNING = 2
+    STOPPING = 3
+
+
+# Output directories already created by this process
+_CREATED_DIRS: Set[str] = set()
+
+# X11 display to capture
+_X11_DISPLAY = ":0.0"
+
+# Scheduling priority for ffmpeg, below the session being recorded
+_FFMPEG_NICENESS = 10
+
+# Most x264 threads worth running per capture size, as (max pixels, threads);
+# more threads than this add frame latency without keeping up any better
+_X264_THREAD_CAPS = ((1280 * 720, 2), (1920 * 1080, 4))
+
+
+@lru_cache(maxsize=None)
+def _ffmpeg_executable() -> str:
+    """
+    @brief Resolve the absolute path of ffmpeg once per process.
+
+    subprocess only takes its posix_spawn fast path for an executable with a directory component.
+
+    @return Absolute path to ffmpeg, or plain "ffmpeg" if it isn't on PATH.
+    """
+    return shutil.which("ffmpeg") or "ffmpeg"
+
+
+@lru_cache(maxsize=None)
+def _detect_hw_encoder() -> Optional[str]:
+    """
+    @brief Find a usable hardware H.264 encoder.
+
+    Encoders listed by ffmpeg are confirmed with a one-frame test encode, since
+    builds often ship them without a matching GPU or driver. The test encodes
+    run concurrently under one shared time limit, so a hanging driver can't
+    stall setup. Probed once per process.
+
+    @return Encoder name, or None if libx264 should be used.
+    """
+    try:
+        listing = subprocess.run(
+            [_ffmpeg_executable(), "-hide_banner", "-encoders"],
+            stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=5
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+    # Start every test encode at once, in order of preference
+    probes: Dict[str, subprocess.Popen] = {}
+    for encoder in _HW_QUALITY_PRESETS:
+        if encoder not in listing:
+            continue
+        probe = [
+            _ffmpeg_executable(), "-hide_banner", "-loglevel", "error",
+            *_HW_INPUT_OPTIONS.get(encoder, ()),
+            "-f", "lavfi", "-i", "color=size=256x256",
+            "-frames:v", "1",
+            "-vf", _HW_UPLOAD_FILTERS.get(encoder, "format=yuv420p"),
+            "-c:v", encoder,
+            "-f", "null", "-"
+        ]
+        try:
+            probes[encoder] = subprocess.Popen(
+                probe, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                close_fds=False,
+            )
+        except OSError:
+            continue
+
+    deadline = time.monotonic() + _HW_PROBE_TIMEOUT
+    chosen: Optional[str] = None
+    for encoder, process in probes.items():
+        if chosen is None:
+            try:
+                if process.wait(timeout=max(0.0, deadline - time.monotonic())) == 0:
+                    chosen = encoder
+            except subprocess.TimeoutExpired:
+                pass
+        # Less preferred or hung probes are no longer needed
+        if process.poll() is None:
+            process.kill()
+            process.wait()
+
+    return chosen
+
+
+@lru_cache(maxsize=None)
+def _display_size(display: str) -> Optional[Tuple[int, int]]:
+    """
+    @brief Query the X11 screen size, rounded down to even dimensions.
+
+    yuv420p needs even dimensions, so grabbing this size directly makes a
+    per-frame crop filter unnecessary. Queried once per process.
+
+    @param display X11 display identifier.
+    @return (width, height), or None if xdpyinfo is unavailable or fails.
+    """
+    try:
+        info = subprocess.run(
+            ["xdpyinfo", "-display", display],
+            stdin=subprocess.DEVNULL, capture_output=True, text=True, timeout=5
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+    for line in info.splitlines():
+        # e.g. "  dimensions:    1920x1080 pixels (508x285 millimeters)"
+        if line.lstrip().startswith("dimensions:"):
+            try:
+                width, height = map(int, line.split()[1].split("x"))
+            except ValueError:
+                return None
+            return width & ~1, height & ~1
+
+    return None
+
+
+@lru_cache(maxsize=None)
+def _encoder_cpus() -> Optional[Tuple[int, ...]]:
+    """
+    @brief Pick the CPUs ffmpeg is pinned to, leaving the rest to the recorded session.
+
+    Uses the last quarter of the CPUs this process may run on, at least two.
+    Machines with fewer than four CPUs are not partitioned.
+
+    @return Sorted CPU ids, or None if ffmpeg should not be pinned.
+    """
+    if not hasattr(os, "sched_getaffinity"):
+        return None
+    available = sorted(os.sched_getaffinity(0))
+    if len(available) < 4:
+        return None
+    return tuple(available[-max(2, len(available) // 4):])
+
+
+@lru_cache(maxsize=None)
+def _scheduling_prefix() -> Tuple[Tuple[str, ...], bool, bool]:
+    """
+    @brief Build the nice/taskset wrapper that starts ffmpeg deprioritized and pinned.
+
+    Priority and affinity set before exec are inherited by every thread ffmpeg
+    creates, including x264's workers. Both tools exec ffmpeg in place, so the
+    pid is unchanged, and with absolute paths subprocess keeps its posix_spawn path.
+
+    @return (argv prefix, whether it sets the priority, whether it sets the affinity).
+    """
+    prefix: List[str] = []
+    nice = shutil.which("nice")
+    if nice:
+        prefix += [nice, "-n", str(_FFMPEG_NICENESS)]
+    encoder_cpus = _encoder_cpus()
+    taskset = shutil.which("taskset") if encoder_cpus else None
+    if taskset:
+        prefix += [taskset, "-c", ",".join(map(str, encoder_cpus))]
+    return tuple(prefix), nice is not None, taskset is not None
+
+
+def _x264_threads(screen_size: Optional[Tuple[int, int]]) -> Optional[int]:
+    """
+    @brief Choose the libx264 thread count for a capture size.
+
+    One thread per CPU ffmpeg is pinned to, capped according to the resolution.
+
+    @param screen_size Capture (width, height), or None if unknown.
+    @return Thread count, or None to leave the choice to x264.
+    """
+    encoder_cpus = _encoder_cpus()
+    threads = len(encoder_cpus) if encoder_cpus else None
+    if screen_size:
+        pixels = screen_size[0] * screen_size[1]
+        for max_pixels, cap in _X264_THREAD_CAPS:
+            if pixels <= max_pixels:
+                threads = min(threads, cap) if threads else cap
+                break
+    return threads
+
+
+# Recorders with a live ffmpeg process, keyed by pid
+_LIVE_RECORDERS: Dict[int, "VideoRecorder"] = {}
+_sigchld_installed = False
+_previous_sigchld_handler: Any = None
+
+
+def install_sigchld_handler() -> bool:
+    """
+    @brief Install a process-wide SIGCHLD handler that reaps live ffmpeg processes.
+
+    The handler only polls the registered ffmpeg processes by pid, so exit statuses
+    of other children (tmux, asciinema) are left to their own subprocess calls.
+    Without it, VideoRecorder polls for ffmpeg's exit instead. Signal handlers
+    can only be installed from the main thread; undo with restore_sigchld_handler().
+
+    @return True if the handler is installed, False if exit has to be polled instead.
+    """
+    global _sigchld_installed, _previous_sigchld_handler
+    if _sigchld_installed:
+        return True
+    if not hasattr(signal, "SIGCHLD") or threading.current_thread() is not threading.main_thread():
+        return False
+
+    previous_handler = signal.getsignal(signal.SIGCHLD)
+
+    def _on_sigchld(signum, frame) -> None:
+        for recorder in list(_LIVE_RECORDERS.values()):
+            recorder._reap()
+        if callable(previous_handler):
+            previous_handler(signum, frame)
+
+    signal.signal(signal.SIGCHLD, _on_sigchld)
+    _previous_sigchld_handler = previous_handler
+    _sigchld_installed = True
+    return True
+
+
+def restore_sigchld_handler() -> None:
+    """
+    @brief Put back the SIGCHLD handler that install_sigchld_handler() replaced.
+
+    Must be called from the main thread. Does nothing if the handler isn't installed.
+    """
+    global _sigchld_installed, _previous_sigchld_handler
+    if not _sigchld_installed:
+        return
+    # Handlers installed outside Python are reported as None and can't be restored
+    previous_handler = _previous_sigchld_handler
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL if previous_handler is None else previous_handler)
+    _previous_sigchld_handler = None
+    _sigchld_installed = False
+
 
 class VideoRecorder(AbstractRecorder):
     """
@@ -16,7 +301,7 @@ class VideoRecorder(AbstractRecorder):
     Uses ffmpeg to record the screen as a single video file.
     """
 
-    def __init__(self, static_config: AppStaticSettings, session_config: AppSessionConfig,output_dir: Optional[Path] = None):
+    def __init__(self, static_config: AppStaticSettings, session_config: AppSessionConfig,output_dir: Optional[Path] = None, low_latency: bool = True):
         """
         @brief Initialize the video recorder
 
@@ -24,6 +309,7 @@ class VideoRecorder(AbstractRecorder):
         @param video_quality Encoder quality setting (low, medium, high)
         @param framerate Capture framerate (lower means smaller file size)
         @param output_dir Optional custom directory to save recordings
+        @param low_latency Add real-time capture buffering and zero-latency encoder tuning
         """
         # Config
         self.static_config: AppStaticSettings = static_config
@@ -31,48 +317,62 @@ class VideoRecorder(AbstractRecorder):
 
         self.video_quality = 'low'
         self.framerate = 15
+        self.low_latency = low_latency
+
+        # Use medium quality if specified quality not found
+        self._video_settings: List[str] = list(_QUALITY_PRESETS.get(self.video_quality, _QUALITY_PRESETS["medium"]))
+        self._hw_encoder: Optional[str] = None
+        # Full ffmpeg argv, built by setup() once the encoder is known
+        self._ffmpeg_cmd: Optional[List[str]] = None
 
         # Set output directory
         self.output_dir = output_dir or self.session_config.video_dir
         self._output_file=self.session_config.video_file
+        # ffmpeg writes here; the file is renamed to _output_file once ffmpeg exits cleanly
+        self._partial_file = self._output_file.with_name(self._output_file.name + ".part")
 
         # Internal state
         self._process: Optional[subprocess.Popen] = None
-        self._thread: Optional[threading.Thread] = None
-        self._start_time = datetime.now()
+        self._started = threading.Event()
+        self._stderr_tail: deque = deque(maxlen=_STDERR_TAIL_LINES)
+        self._stderr_drain: Optional[threading.Thread] = None
+        self._start_monotonic: float = time.monotonic()
 
-        self._is_recording=False
-
-    def _get_video_settings(self) -> List[str]:
-        """
-        @brief Get ffmpeg settings based on quality setting
-
-        @return List of ffmpeg parameters
-        """
-        # Quality preset mapping
-        quality_presets = {
-            "low": ["-c:v", "libx264", "-preset", "ultrafast", "-crf", "28"],
-            "medium": ["-c:v", "libx264", "-preset", "medium", "-crf", "23"],
-            "high": ["-c:v", "libx264", "-preset", "slow", "-crf", "18"]
-        }
-
-        # Use medium quality if specified quality not found
-        return quality_presets.get(self.video_quality, quality_presets["medium"])
+        self._state: _State = _State.IDLE
 
     def setup(self) -> None:
         """
         @brief Perform any necessary setup before recording can begin.
 
-        Creates the output directory if it doesn't exist.
+        Creates the output directory if it doesn't exist, switches to a
+        hardware encoder when one is available and builds the ffmpeg command.
+        The encoder and command don't change between recordings, so they are
+        only resolved on the first call.
         """
         # Create output directory if it doesn't exist
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+        output_dir = str(self.output_dir)
+        if output_dir not in _CREATED_DIRS:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            _CREATED_DIRS.add(output_dir)
+
+        if self._ffmpeg_cmd is not None:
+            return
+
+        # Prefer a hardware encoder to keep the encode off the CPU
+        self._hw_encoder = _detect_hw_encoder()
+        if self._hw_encoder:
+            presets = _HW_QUALITY_PRESETS[self._hw_encoder]
+            self._video_settings = list(presets.get(self.video_quality, presets["medium"]))
+
+        self._ffmpeg_cmd = self._build_ffmpeg_command()
 
     def start_recording(self) -> None:
         """
         @brief Start the screen recording process
 
-        Launches ffmpeg in a separate thread to record the screen
+        Launches ffmpeg in the background to record the screen. The process is
+        not watched by a helper thread; its exit status is read from the Popen
+        handle when needed.
         """
         # if self.is_recording:
         #     print("video Recording is already in progress")
@@ -81,101 +381,297 @@ class VideoRecorder(AbstractRecorder):
         # Setup before recording
         self.setup()
 
-        self._is_recording = True
+        self._state = _State.STARTING
+        self._started.clear()
+        self._start_monotonic = time.monotonic()
 
-        # Start recording in a separate thread
-        self._thread = threading.Thread(target=self._recording_thread)
-        self._thread.daemon = True
-        self._thread.start()
+        self._launch_ffmpeg()
 
-    def _recording_thread(self) -> None:
+    def _build_ffmpeg_command(self) -> List[str]:
         """
-        @brief Thread function that handles the recording process
+        @brief Build the ffmpeg screen capture command line.
 
-        Manages ffmpeg process for continuous recording
+        @return ffmpeg argv writing to the partial output file.
         """
-        # Get quality settings
-        video_settings = self._get_video_settings()
+        video_settings = self._video_settings
+
+        input_options: List[str] = []
+        if self.low_latency:
+            # Skip input probing and buffering; the grabber's format is known up front
+            input_options = ["-fflags", "nobuffer", "-flags", "low_delay", "-probesize", "32", "-analyzeduration", "0"]
+            # Buffer more captured frames so the grabber doesn't drop them under load
+            input_options += ["-rtbufsize", "100M", "-thread_queue_size", "512"]
+            if "libx264" in video_settings:
+                # Frame-in/frame-out encoding: no lookahead, B-frames or extra reference frames
+                video_settings = [*video_settings, "-tune", "zerolatency", "-bf", "0", "-refs", "1"]
+
+        screen_size = _display_size(_X11_DISPLAY)
+        if "libx264" in video_settings:
+            threads = _x264_threads(screen_size)
+            if threads:
+                video_settings = [*video_settings, "-threads", str(threads)]
+
+        # Grabbing an even-sized area avoids cropping every frame; crop only if the size is unknown
+        if screen_size:
+            input_options = [*input_options, "-video_size", "{}x{}".format(*screen_size)]
+            filter_chain = []
+        else:
+            filter_chain = ["crop=iw:floor(ih/2)*2"]
+
+        # Hardware upload replaces the software pixel format conversion
+        pixel_format = ["-pix_fmt", "yuv420p"]  # Ensure compatibility
+        upload_filter = _HW_UPLOAD_FILTERS.get(self._hw_encoder)
+        if upload_filter:
+            filter_chain.append(upload_filter)
+            pixel_format = []
+        filters = ["-vf", ",".join(filter_chain)] if filter_chain else []
 
         # Build the ffmpeg command
         # This works on most Linux systems with X11
         cmd = [
-            "ffmpeg",
+            *_scheduling_prefix()[0],
+            _ffmpeg_executable(),
+            "-y",                 # Overwrite a leftover partial file without prompting
+            *_HW_INPUT_OPTIONS.get(self._hw_encoder, ()),
             "-f", "x11grab",      # X11 display grabbing
             "-framerate", str(self.framerate),
-            "-i", ":0.0",         # Display identifier
-            "-r", str(self.framerate),
-            "-vf", "crop=iw:floor(ih/2)*2",
+            *input_options,
+            "-i", _X11_DISPLAY,
+            *filters,
             *video_settings,
-            "-pix_fmt", "yuv420p",  # Ensure compatibility
+            "-g", str(self.framerate * 2),  # Keyframe, and so an MP4 fragment, every two seconds
+            *pixel_format,
+            # Fragmented MP4: no moov atom to write at shutdown, and a killed recording stays playable;
+            # self-contained one-second fragments also let other tools read the file while it grows
+            "-movflags", "+frag_keyframe+empty_moov+default_base_moof",
+            "-frag_duration", "1000000",
             "-f", "mp4",
             "-loglevel", "error",   # Reduce ffmpeg output to errors only
-            str(self._output_file)
+            str(self._partial_file)
         ]
+        return cmd
 
+    def _launch_ffmpeg(self) -> None:
+        """
+        @brief Spawn the ffmpeg screen capture process
+
+        Starts the command prepared by setup() without waiting for it to exit.
+        """
         # Start ffmpeg process for screen recording
         try:
-            # Using subprocess.PIPE for stderr to properly capture errors
+            # stderr is drained continuously so ffmpeg never blocks on a full pipe
             self._process = subprocess.Popen(
-                cmd,
+                self._ffmpeg_cmd,
                 stdin=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
+                # A stray non-UTF-8 byte in ffmpeg's output must not stop the stderr drain
+                encoding="utf-8",
+                errors="replace",
+                # No fd closing pass lets subprocess use posix_spawn instead of fork+exec
+                close_fds=False,
             )
-
-            self._process.wait()
+            self._deprioritize(self._process.pid)
+            self._stderr_tail.clear()
+            self._stderr_drain = threading.Thread(
+                target=self._drain_stderr, args=(self._process.stderr,), daemon=True
+            )
+            self._stderr_drain.start()
+            self._state = _State.RUNNING
+            _LIVE_RECORDERS[self._process.pid] = self
+            # Catch an exit that happened before the process was registered
+            self._reap()
+            self._started.set()
 
         except Exception as e:
             # Ensure proper line breaks in error messages
             print(f"\nError during video recording: {e}")
-            self._is_recording = False
+            self._state = _State.IDLE
+            self._started.set()
+
+    def _reap(self) -> None:
+        """
+        @brief Collect the ffmpeg exit status if the process has ended.
+
+        Called from the SIGCHLD handler. Popen.poll() only waits on this pid and
+        never blocks, even while another thread is inside wait(). The state is
+        left to the start/stop paths.
+        """
+        process = self._process
+        if process is None or process.poll() is None:
+            return
+        _LIVE_RECORDERS.pop(process.pid, None)
+
+    @staticmethod
+    def _deprioritize(pid: int) -> None:
+        """
+        @brief Lower ffmpeg's priority and pin it, where the nice/taskset wrapper couldn't.
+
+        Fallback for systems without nice or taskset, applied after spawning
+        rather than through preexec_fn, which would rule out the posix_spawn
+        fast path. On Linux both calls only reach ffmpeg's main thread, so
+        threads it has already started keep the defaults; this is best-effort.
+        Failures are ignored.
+
+        @param pid ffmpeg process id.
+        """
+        _, niced, pinned = _scheduling_prefix()
+        if not niced:
+            try:
+                os.setpriority(os.PRIO_PROCESS, pid, _FFMPEG_NICENESS)
+            except (AttributeError, OSError):
+                pass
+
+        encoder_cpus = _encoder_cpus()
+        if encoder_cpus and not pinned:
+            try:
+                os.sched_setaffinity(pid, encoder_cpus)
+            except OSError:
+                pass
+
+    def _drain_stderr(self, pipe) -> None:
+        """
+        @brief Read ffmpeg's stderr until it closes, keeping only the last lines.
+
+        Runs on a daemon thread for the lifetime of the process.
+
+        @param pipe ffmpeg's stderr pipe.
+        """
+        try:
+            for line in pipe:
+                self._stderr_tail.append(line.rstrip())
+        except (OSError, ValueError):
+            pass
+        finally:
+            pipe.close()
+
+    def _print_stderr_tail(self) -> None:
+        """
+        @brief Print the last lines ffmpeg wrote to stderr, if any.
+        """
+        if self._stderr_tail:
+            print("ffmpeg output:\n" + "\n".join(self._stderr_tail))
+
+    def wait_until_started(self, timeout: float) -> bool:
+        """
+        @brief Block until ffmpeg has been launched and has survived a grace period.
 
+        ffmpeg reports a bad display, encoder or output path by exiting right
+        away, so a process still alive once the timeout ends counts as started.
+
+        @param timeout Grace period in seconds, including the wait for the launch.
+        @return True if ffmpeg is still running after the grace period, False otherwise.
+        """
+        deadline = time.monotonic() + timeout
+        if not self._started.wait(timeout):
+            return False
+        process = self._process
+        if process is None:
+            return False
+        try:
+            process.wait(timeout=max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            return True
+        return False
+
+    @property
     def is_recording(self) -> bool:
-        process_running = self._process is not None and self._process.poll() is None
-        return self._is_recording and process_running
+        # Read the process handle once so a concurrent reset can't split the check
+        process = self._process
+        if self._state is not _State.RUNNING or process is None:
+            return False
+        if _sigchld_installed:
+            # The SIGCHLD handler (or a waiter) sets returncode once ffmpeg exits
+            return process.returncode is None
+        return process.poll() is None
+
+    def _forget_process(self) -> None:
+        """
+        @brief Drop the ffmpeg process handle and its SIGCHLD registration.
+        """
+        if self._process is not None:
+            _LIVE_RECORDERS.pop(self._process.pid, None)
+        self._process = None
 
     def stop_recording(self):
         """
         @brief Stop the ongoing recording
 
-        @return Path to the recorded video file, or None if no recording was in progress
+        If ffmpeg already exited on its own, the recording is reported as failed
+        along with ffmpeg's last error output.
+
+        @return Result dictionary with the recorded video file, or an empty one if no
+                recording was in progress or the recording failed
         """
-        if not self.is_recording():
+        if self._process is None:
             print("No recording in progress")
-            self._process = None
-            self._thread = None
+            self._state = _State.IDLE
             return {}
 
-        self._is_recording = False
+        self._state = _State.STOPPING
         recorded_file_path = self._output_file
 
-        # Terminate the ffmpeg process
-        try:
-            if self._process.stdin and not self._process.stdin.closed:
-                self._process.stdin.write('q\n')
-                self._process.stdin.flush()
-            else:
-                print("stdin is already closed, cannot send 'q'")
+        killed = False
+        interrupted = False
+        exited_early = self._process.poll() is not None
 
-            self._process.wait(timeout=10)
+        # Terminate the ffmpeg process unless it already exited on its own
+        try:
+            if not exited_early:
+                if self._process.stdin and not self._process.stdin.closed:
+                    # Send 'q' and close stdin; stderr is consumed by the drain thread
+                    try:
+                        self._process.stdin.write('q\n')
+                        self._process.stdin.close()
+                    except BrokenPipeError:
+                        # ffmpeg already exited
+                        pass
+                else:
+                    print("stdin is already closed, cannot send 'q'")
+                self._process.wait(timeout=10)
+            elif self._process.stdin:
+                # Nothing left to stop; the drain thread holds ffmpeg's reason for exiting
+                self._process.stdin.close()
 
         except subprocess.TimeoutExpired:
-            print("Timeout waiting for ffmpeg to stop. Forcing kill.")
-            self._process.kill()
-            self._process.wait()
+            # SIGINT is ffmpeg's own graceful stop; kill only if that is ignored too
+            print("Timeout waiting for ffmpeg to stop. Sending SIGINT.")
+            self._process.send_signal(signal.SIGINT)
+            interrupted = True
+            try:
+                self._process.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                print("ffmpeg did not stop. Forcing kill.")
+                self._process.kill()
+                self._process.wait()
+                killed = True
         except Exception as e:
             print(f"Error stopping ffmpeg: {e}")
 
-        if self._thread and self._thread.is_alive():
-            self._thread.join(timeout=5)
+        # The pipe reaches EOF once ffmpeg has exited
+        if self._stderr_drain is not None:
+            self._stderr_drain.join(timeout=2)
+            self._stderr_drain = None
+
+        # One stat covers both the existence and the size check
+        try:
+            partial_size: Optional[int] = os.stat(self._partial_file).st_size
+        except FileNotFoundError:
+            partial_size = None
+
+        # A failed or crashed ffmpeg leaves a .part file that must not be published
+        returncode = self._process.returncode
+        finished_cleanly = not killed and not exited_early and (
+            returncode == 0 or (interrupted and returncode == _FFMPEG_SIGINT_STATUS)
+        )
 
-        final_file_exists = recorded_file_path and recorded_file_path.exists()
-        final_file_has_size = final_file_exists and recorded_file_path.stat().st_size > 0
+        if partial_size and finished_cleanly:
+            # Publish the finished recording atomically
+            os.replace(self._partial_file, recorded_file_path)
 
-        if final_file_has_size:
             # Calculate recording duration
-            duration = datetime.now() - self._start_time
-            hours, remainder = divmod(duration.seconds, 3600)
+            elapsed = int(time.monotonic() - self._start_monotonic)
+            hours, remainder = divmod(elapsed, 3600)
             minutes, seconds = divmod(remainder, 60)
 
             result = {
@@ -184,20 +680,32 @@ class VideoRecorder(AbstractRecorder):
             },
             "metadata": {
                 "project_name": self.session_config.project_name,
-                "duration": str(datetime.now() - self._start_time),
+                "duration": str(timedelta(seconds=elapsed)),
                 "time": f"{hours}h_{minutes}m_{seconds}s"
             }
         }
-        elif final_file_exists:
-            print(f"Recorded File '{recorded_file_path}' is Empty.")
+        elif partial_size:
+            if killed:
+                reason = "Recording was interrupted"
+            elif exited_early:
+                reason = f"ffmpeg stopped unexpectedly with status {returncode}"
+            else:
+                reason = f"ffmpeg exited with status {returncode}"
+            print(f"{reason}. Partial file kept at '{self._partial_file}'.")
+            self._print_stderr_tail()
+            result = {}
+        elif partial_size is not None:
+            print(f"Recorded File '{self._partial_file}' is Empty.")
+            self._print_stderr_tail()
             result = {}
         else:
             print("Recorded File is not Generated.")
+            self._print_stderr_tail()
             result = {}
 
         # Reset internal state for next recording
-        self._process = None
-        self._thread = None
+        self._forget_process()
+        self._state = _State.IDLE
 
         return result
 
@@ -221,10 +729,39 @@ class VideoRecorder(AbstractRecorder):
         """
         @brief Wait for the video recording to complete.
 
-        Since video recording runs in a separate thread, this method
-        checks if the recording thread is still active and waits for it to finish.
+        Blocks until the ffmpeg process exits.
         """
         # video recorder is not required this method
-        if self._is_recording and self._thread and self._thread.is_alive():
-            # タイムアウトを設定しない場合は、スレッドが完全に終了するまで待機
-            self._thread.join()
\ No newline at end of file
+        process = self._process
+        if self._state is _State.RUNNING and process is not None:
+            process.wait()
+
+    async def async_wait_for_completion(self) -> None:
+        """
+        @brief Await the exit of the ffmpeg process without occupying a thread.
+
+        A pidfd for the process is registered with the event loop, which marks
+        it readable once ffmpeg exits. Falls back to a worker thread where
+        pidfd_open is unavailable.
+        """
+        process = self._process
+        if self._state is not _State.RUNNING or process is None:
+            return
+
+        try:
+            pidfd = os.pidfd_open(process.pid)
+        except (AttributeError, OSError):
+            await asyncio.to_thread(process.wait)
+            return
+
+        loop = asyncio.get_running_loop()
+        exited = loop.create_future()
+        loop.add_reader(pidfd, lambda: exited.done() or exited.set_result(None))
+        try:
+            await exited
+        finally:
+            loop.remove_reader(pidfd)
+            os.close(pidfd)
+
+        # Reap the exited process and record its return code
+        process.wait()
@@ -0,0 +1,32 @@
+from typing import Dict, Any
+from Reporter.ab_reporter import AbstractReporter
+
+class NullReporter(AbstractReporter):
+    """
+    @brief Reporter that prints nothing.
+
+    Stands in for the real reporters in quiet mode so callers don't need to branch.
+    """
+    def print_session_start(self, session_info: Dict[str, Any]) -> None:
+        """
+        @brief Ignore the session start.
+        """
+        pass
+
+    def print_recording_start(self) -> None:
+        """
+        @brief Ignore the recording start.
+        """
+        pass
+
+    def print_recorder_results(self, results: Dict[str, Any]) -> None:
+        """
+        @brief Ignore the recording results.
+        """
+        pass
+
+    def print_recording_end(self) -> None:
+        """
+        @brief Ignore the recording end.
+        """
+        pass
@@ -1,8 +1,17 @@
+import sys
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Dict, Any, Optional
 from Reporter.ab_reporter import AbstractReporter
 
+# Result line format for each tmux recording output type
+_OUTPUT_FORMATS = {
+    "asciinema": "- Asciinema recording: {}".format,
+    "zsh_history": "- Zsh history: {}".format,
+    "tmux_logs": "- Tmux logs: {}/*.log".format,
+}
+_BAR_EQ: str = "=" * 60
+
 class TmuxSessionReporter(AbstractReporter):
     """
     @brief Reporter for tmux session recording.
@@ -13,22 +22,24 @@ class TmuxSessionReporter(AbstractReporter):
         """
         @brief Print information about the tmux recording end.
         """
-        print("[✓] Asciinema recording completed.")
+        sys.stdout.write("[✓] Asciinema recording completed.\n")
     def print_session_start(self, session_info: Dict[str, Any]) -> None:
         """
         @brief Print information about the starting tmux session.
 
         @param session_info Dictionary containing session details.
         """
-        print("=" * 60)
-        print(f"Recording session for project: {session_info['project_name']}")
-        print(f"Date: {session_info['date']}, Time: {session_info['time']}")
+        sys.stdout.write(
+            f"{_BAR_EQ}\n"
+            f"Recording session for project: {session_info['project_name']}\n"
+            f"Date: {session_info['date']}, Time: {session_info['time']}\n"
+        )
 
     def print_recording_start(self) -> None:
         """
         @brief Print information about the recording session by asciinema.
         """
-        print("[+] Starting asciinema recording.")
+        sys.stdout.write("[+] Starting asciinema recording.\n")
 
     def print_recorder_results(self, results: Dict[str, Any]) -> None:
         """
@@ -36,11 +47,9 @@ class TmuxSessionReporter(AbstractReporter):
         """
         outputs = results.get("outputs", {})
 
-        print("\nRecording outputs:")
+        lines = ["\nRecording outputs:"]
         for output_type, path in outputs.items():
-            if output_type == "asciinema":
-                print(f"- Asciinema recording: {path}")
-            elif output_type == "zsh_history":
-                print(f"- Zsh history: {path}")
-            elif output_type == "tmux_logs":
-                print(f"- Tmux logs: {path}/*.log")
+            format_line = _OUTPUT_FORMATS.get(output_type)
+            if format_line:
+                lines.append(format_line(path))
+        sys.stdout.write("\n".join(lines) + "\n")
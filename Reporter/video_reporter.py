@@ -1,8 +1,11 @@
+import sys
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Dict, Any, Optional
 from Reporter.ab_reporter import AbstractReporter
 
+_BAR_DASH: str = "-" * 60
+
 class VideoReporter(AbstractReporter):
     """
     @brief Reporter for video recording.
@@ -16,15 +19,13 @@ class VideoReporter(AbstractReporter):
 
         @param session_info Dictionary containing session details.
         """
-        print("-" * 60)
-        print("Video recording: Enabled")
-        print("-" * 60)
+        sys.stdout.write(f"{_BAR_DASH}\nVideo recording: Enabled\n{_BAR_DASH}\n")
 
     def print_recording_start(self) -> None:
         """
         @brief Print information about starting video recording.
         """
-        print("[+] Starting video recording...")
+        sys.stdout.write("[+] Starting video recording...\n")
 
     def print_recorder_results(self, results: Dict[str, Any]) -> None:
         """
@@ -34,9 +35,9 @@ class VideoReporter(AbstractReporter):
 
         if "video" in outputs:
             video_path = outputs["video"]
-            print(f"- Video recording: {video_path}")
+            sys.stdout.write(f"- Video recording: {video_path}\n")
     def print_recording_end(self) -> None:
         """
         @brief Print information about the video recording end.
         """
-        print("[✓] Video recording completed.")
+        sys.stdout.write("[✓] Video recording completed.\n")
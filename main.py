@@ -1,25 +1,35 @@
-import argparse
-from typing import Optional
 import sys
 sys.dont_write_bytecode = True
 
-from settingcode.app_static_config import AppStaticSettings
-from Recorder.asciinema_recorder import TmuxAsciinemaRecorder
-from Recorder.video_recorder import VideoRecorder
-from Recorder.composite_recorder import CompositeRecorder
-from Reporter.tmux_asciinema_reporter import TmuxSessionReporter
-from Reporter.video_reporter import VideoReporter
-from misc.resource_cleaner import ResourceCleaner
-from settingcode.app_session_config import AppSessionConfig
+from functools import cache
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
+if TYPE_CHECKING:
+    import argparse
 
-def main() -> None:
+# Options understood by the argparse-free fast path, mapped to their destinations
+_FAST_FLAGS: Dict[str, str] = {"--keep_tmp": "keep_tmp", "--quiet": "quiet", "--video": "video"}
+_FAST_VALUE_OPTIONS: Dict[str, str] = {
+    "--session": "session",
+    "--video-quality": "video_quality",
+    "--video-framerate": "video_framerate",
+}
+_VIDEO_QUALITIES = ("low", "medium", "high")
+_CLOSING_BAR: str = "=" * 60 + "\n"
+
+
+@cache
+def _build_parser() -> 'argparse.ArgumentParser':
     """
-    @brief Entry point for the application.
+    @brief Build the command-line argument parser.
 
-    Parses command-line arguments and initializes the recording process.
+    The parser layout is static, so it is built once and cached.
+
+    @return Parser for the recorder's command-line options.
     """
-    # Set up command-line argument parsing
+    import argparse
+
     parser = argparse.ArgumentParser(description="Record a tmux session with asciinema, zsh logging, and optional video recording.")
     parser.add_argument("project", help="Project name (used to create directory structure)")
     parser.add_argument("--session", help="tmux session name (default: project_name_date)")
@@ -29,12 +39,83 @@ def main() -> None:
     # Video recording options
     video_group = parser.add_argument_group("Video Recording Options")
     video_group.add_argument("--video", action="store_true", help="enable video recording")
-    video_group.add_argument("--video-quality", choices=["low", "medium", "high"], default="medium",
+    video_group.add_argument("--video-quality", choices=list(_VIDEO_QUALITIES), default="medium",
                             help="video recording quality (default: medium)")
     video_group.add_argument("--video-framerate", type=int, default=15,
                             help="video recording framerate (default: 15)")
 
-    args = parser.parse_args()
+    return parser
+
+
+def _fast_parse(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    @brief Parse the common command-line shapes without argparse.
+
+    Anything unusual (help, unknown or abbreviated options, malformed values)
+    yields None so that the full parser can handle it and report errors.
+
+    @param argv Command-line arguments without the program name.
+    @return Parsed arguments, or None if argparse is needed.
+    """
+    args = SimpleNamespace(project=None, session=None, keep_tmp=False, quiet=False,
+                           video=False, video_quality="medium", video_framerate=15)
+    index = 0
+    while index < len(argv):
+        arg = argv[index]
+        index += 1
+        if not arg.startswith("-"):
+            if args.project is not None:
+                return None
+            args.project = arg
+        elif arg in _FAST_FLAGS:
+            setattr(args, _FAST_FLAGS[arg], True)
+        else:
+            name, has_value, value = arg.partition("=")
+            if name not in _FAST_VALUE_OPTIONS:
+                return None
+            if not has_value:
+                if index >= len(argv) or argv[index].startswith("-"):
+                    return None
+                value = argv[index]
+                index += 1
+            setattr(args, _FAST_VALUE_OPTIONS[name], value)
+
+    if args.project is None or args.video_quality not in _VIDEO_QUALITIES:
+        return None
+    try:
+        args.video_framerate = int(args.video_framerate)
+    except ValueError:
+        return None
+
+    return args
+
+
+def main() -> None:
+    """
+    @brief Entry point for the application.
+
+    Parses command-line arguments and initializes the recording process.
+    """
+    # Keep progress lines visible when stdout is redirected, without unbuffered writes;
+    # replacement streams (captured or embedded stdout) may not support reconfigure
+    reconfigure = getattr(sys.stdout, "reconfigure", None)
+    if reconfigure is not None:
+        reconfigure(line_buffering=True, write_through=False)
+
+    args = _fast_parse(sys.argv[1:]) or _build_parser().parse_args()
+
+    # Recorder modules pull in asyncio and subprocess, so they are only
+    # imported once the arguments are known to be valid
+    from settingcode.app_static_config import AppStaticSettings
+    from settingcode.app_session_config import AppSessionConfig
+    from Recorder.ab_recorder import AbstractRecorder
+    from Recorder.asciinema_recorder import TmuxAsciinemaRecorder
+    from Recorder.composite_recorder import CompositeRecorder
+    from Reporter.ab_reporter import AbstractReporter
+    from Reporter.tmux_asciinema_reporter import TmuxSessionReporter
+    from Reporter.video_reporter import VideoReporter
+    from Reporter.null_reporter import NullReporter
+    from misc.resource_cleaner import ResourceCleaner
 
     # Initialize configuration
     static_config = AppStaticSettings.from_defaults()
@@ -42,6 +123,10 @@ def main() -> None:
 
     composite_recorder = CompositeRecorder(project_name=args.project)
 
+    # Initialize reporters using the abstract class (silent ones in quiet mode)
+    tmux_reporter: AbstractReporter = NullReporter() if args.quiet else TmuxSessionReporter()
+    video_reporter: AbstractReporter = NullReporter() if args.quiet else VideoReporter()
+
     # Add tmux recorder
     tmux_recorder = TmuxAsciinemaRecorder(
         static_config=static_config,
@@ -49,51 +134,52 @@ def main() -> None:
         tmux_session_name=args.session,
     )
     composite_recorder.add_recorder(tmux_recorder)
+    reporter_pairs: List[Tuple[AbstractRecorder, AbstractReporter]] = [(tmux_recorder, tmux_reporter)]
 
     # Add video recorder if enabled
     if args.video:
+        from Recorder.video_recorder import VideoRecorder, install_sigchld_handler, restore_sigchld_handler
+
         video_recorder = VideoRecorder(
             static_config=static_config,
             session_config=session_config,
         )
         composite_recorder.add_recorder(video_recorder)
+        reporter_pairs.append((video_recorder, video_reporter))
 
-    # Initialize reporters using the abstract class
-    tmux_reporter: TmuxSessionReporter = TmuxSessionReporter()
-    video_reporter: VideoReporter = VideoReporter()
-
-    # Get session information
-    session_info = composite_recorder.get_session_info()
-
-    # Display start information (unless quiet mode is enabled)
-    if not args.quiet:
-        tmux_reporter.print_session_start(session_info["TmuxAsciinemaRecorder"])
+    # Display start information for each recorder
+    for recorder, reporter in reporter_pairs:
+        reporter.print_session_start(recorder.get_session_info())
 
-        # Print video recording info if enabled
-        if args.video:
-            video_reporter.print_session_start(session_info["VideoRecorder"])
+    # Reap ffmpeg from a SIGCHLD handler instead of polling for its exit
+    if args.video:
+        install_sigchld_handler()
 
-    # Setup recorders
-    composite_recorder.setup()
+    try:
+        # Setup recorders
+        composite_recorder.setup()
 
-    # Start all recorders
-    if not args.quiet:
+        # Start all recorders
         if args.video:
             video_reporter.print_recording_start()
         tmux_reporter.print_recording_start()
 
-    # Start recording processes
-    composite_recorder.start_recording()
+        # Start recording processes
+        composite_recorder.start_recording()
 
-    # Wait for recordings to complete (blocking until tmux session ends)
-    composite_recorder.wait_for_completion()
+        # Wait for recordings to complete (blocking until tmux session ends)
+        composite_recorder.wait_for_completion()
 
-    # Stop all recorders and collect results
-    results = composite_recorder.stop_recording()
+        # Stop all recorders and collect results
+        results = composite_recorder.stop_recording()
+    finally:
+        # The handler is process-wide, so it must not outlive the recording
+        if args.video:
+            restore_sigchld_handler()
 
     composite_recorder.print_results(results, quiet=args.quiet)
 
-    print("=" * 60)
+    sys.stdout.write(_CLOSING_BAR)
 
     # Clean up temporary resources
     if not args.keep_tmp:
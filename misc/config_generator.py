@@ -1,7 +1,42 @@
+import os
 from pathlib import Path
 from settingcode.app_static_config import AppStaticSettings
 from settingcode.app_session_config import AppSessionConfig
 
+# Hooks that log all pane output and point zsh at the session's ZDOTDIR.
+# Built once at import and filled in with format_map(); tmux's own #{...}
+# formats are escaped as #{{...}}.
+_PIPE_PANE_COMMAND: str = (
+    "'pipe-pane -o \"cat >> {logdir}/"
+    "#{{session_name}}-#{{window_index}}-#{{pane_index}}-%Y%m%d-%H%M%S.log\"'"
+)
+_TMUX_HOOK_TEMPLATE: str = "".join(
+    [f"set-hook -g {hook} {_PIPE_PANE_COMMAND}\n" for hook in ("after-split-window", "after-new-window", "session-created")]
+    + ["set-environment -g ZDOTDIR {tmp_dir}\n"]
+)
+
+
+def _write_small_file(path: Path, *chunks: bytes) -> None:
+    """
+    @brief Write a small file from one or more byte chunks with a single writev.
+
+    Skips the buffered text I/O layers and the concatenation of the chunks,
+    which only add overhead for a sub-page write.
+
+    @param path Destination file path.
+    @param chunks Byte chunks written in order.
+    """
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        written = os.writev(fd, chunks)
+        if written < sum(map(len, chunks)):
+            # Short write, finish the remainder with plain writes
+            remaining = memoryview(b"".join(chunks))[written:]
+            while remaining:
+                remaining = remaining[os.write(fd, remaining):]
+    finally:
+        os.close(fd)
+
 
 class ConfigGenerator:
     """
@@ -34,28 +69,22 @@ class ConfigGenerator:
         tmux_dynamic_path: Path = self.config.tmux_dynamic_conf
 
         # Read default tmux configuration if it exists
-        default_content: str = ""
-        if default_tmux_conf.exists():
-            with open(default_tmux_conf, 'r') as default_file:
-                default_content = default_file.read()
-        else:
+        try:
+            default_content: bytes = default_tmux_conf.read_bytes()
+        except FileNotFoundError:
+            default_content = b""
             print(f"Warning: Default tmux config not found at {default_tmux_conf}")
             print("Using minimal configuration.")
 
         # Add hooks to automatically log all pane output for complete session captures
         # Add zshrc Path for Logging zsh_history
-        logdir: Path = self.paths.tmux_log_dir
-        add_setting: str = f"""
-set-hook -g after-split-window 'pipe-pane -o "cat >> {logdir}/#{{session_name}}-#{{window_index}}-#{{pane_index}}-%Y%m%d-%H%M%S.log"'
-set-hook -g after-new-window 'pipe-pane -o "cat >> {logdir}/#{{session_name}}-#{{window_index}}-#{{pane_index}}-%Y%m%d-%H%M%S.log"'
-set-hook -g session-created 'pipe-pane -o "cat >> {logdir}/#{{session_name}}-#{{window_index}}-#{{pane_index}}-%Y%m%d-%H%M%S.log"'
-set-environment -g ZDOTDIR {self.config.tmp_dir}
-"""
-        full_conf: str = default_content + "\n" + add_setting
+        add_setting: str = _TMUX_HOOK_TEMPLATE.format_map({
+            "logdir": self.paths.tmux_log_dir,
+            "tmp_dir": self.config.tmp_dir,
+        })
 
         # Write to a separate file to avoid modifying user's original configuration
-        with open(tmux_dynamic_path, 'w') as f:
-            f.write(full_conf)
+        _write_small_file(tmux_dynamic_path, default_content, b"\n\n", add_setting.encode())
 
         return tmux_dynamic_path
 
@@ -81,6 +110,6 @@ export SAVEHIST=10000
 setopt INC_APPEND_HISTORY
 setopt SHARE_HISTORY
 """
-        tmp_zshrc.write_text(content)
+        _write_small_file(tmp_zshrc, content.encode())
 
         return self.config.tmp_dir
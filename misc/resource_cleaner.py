@@ -1,6 +1,11 @@
+import os
 import shutil
+import sys
 from pathlib import Path
 
+# shutil.rmtree only accepts dir_fd from Python 3.11 on
+_RMTREE_HAS_DIR_FD = sys.version_info >= (3, 11)
+
 
 class ResourceCleaner:
     """
@@ -25,7 +30,23 @@ class ResourceCleaner:
         """
         # Remove temporary directory
         try:
-            if self.tmp_dir.exists():
-                shutil.rmtree(self.tmp_dir)
+            # The tmp dir holds only a few generated files; unlink them relative
+            # to a directory fd so the kernel doesn't re-walk the full path each time
+            dir_fd = os.open(self.tmp_dir, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                with os.scandir(dir_fd) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if _RMTREE_HAS_DIR_FD:
+                                shutil.rmtree(entry.name, dir_fd=dir_fd)
+                            else:
+                                shutil.rmtree(os.path.join(self.tmp_dir, entry.name))
+                        else:
+                            os.unlink(entry.name, dir_fd=dir_fd)
+            finally:
+                os.close(dir_fd)
+            os.rmdir(self.tmp_dir)
+        except FileNotFoundError:
+            pass
         except Exception as e:
             print(f"Warning: Could not remove temporary directory: {e}")
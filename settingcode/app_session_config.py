@@ -1,9 +1,63 @@
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Optional, Set, Tuple
 import datetime
-from settingcode.app_static_config import AppStaticSettings
+import os
+from settingcode.app_static_config import AppStaticSettings, home_dir
 
-@dataclass
+# Session log directories already created by this process
+_ENSURED_DIRS: Set[Path] = set()
+
+
+def _fmt_yyyymmdd(dt: datetime.datetime) -> str:
+    """
+    @brief Format a date as YYYYMMDD, equivalent to strftime("%Y%m%d").
+
+    @param dt Timestamp to format.
+    @return Fixed-width date string.
+    """
+    return f"{dt.year:04d}{dt.month:02d}{dt.day:02d}"
+
+
+def _fmt_hhmmss(dt: datetime.datetime) -> str:
+    """
+    @brief Format a time as HHMMSS, equivalent to strftime("%H%M%S").
+
+    @param dt Timestamp to format.
+    @return Fixed-width time string.
+    """
+    return f"{dt.hour:02d}{dt.minute:02d}{dt.second:02d}"
+
+
+def _ensure_session_dirs(base_dir: Path, leaf_dirs: Tuple[Path, ...]) -> None:
+    """
+    @brief Create a session log directory and its leaf directories.
+
+    The shared parent chain is created once, then each leaf is created
+    relative to a base dir fd so its path is not re-resolved. Base
+    directories already handled by this process are skipped.
+
+    @param base_dir Session log base directory.
+    @param leaf_dirs Leaf directories directly under base_dir.
+    """
+    if base_dir in _ENSURED_DIRS:
+        return
+
+    base_dir.mkdir(parents=True, exist_ok=True)
+    base_fd = os.open(base_dir, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        for leaf_dir in leaf_dirs:
+            try:
+                os.mkdir(leaf_dir.name, dir_fd=base_fd)
+            except FileExistsError:
+                pass
+    finally:
+        os.close(base_fd)
+    _ENSURED_DIRS.add(base_dir)
+
+
+# Not frozen: the custom __init__ assigns each field itself
+@dataclass(slots=True)
 class AppSessionConfig:
     """
     @brief Class for organizing session-related file paths.
@@ -21,30 +75,29 @@ class AppSessionConfig:
     video_file: Path
     timestamp: datetime
 
-    def __init__(self, project_name: str):
+    def __init__(self, project_name: str, timestamp: Optional[datetime.datetime] = None):
         """
         @brief Initialize session configuration with current timestamp.
 
         @param project_name Name of the project being recorded.
+        @param timestamp Optional session start time. If None, the current time is used.
         """
         self.project_name = project_name
-        self.timestamp = datetime.datetime.now()
-        self.date_str = self.timestamp.strftime("%Y%m%d")
-        self.time_str = self.timestamp.strftime("%H%M%S")
+        self.timestamp = timestamp if timestamp is not None else datetime.datetime.now()
+        self.date_str = _fmt_yyyymmdd(self.timestamp)
+        self.time_str = _fmt_hhmmss(self.timestamp)
 
-        self.base_dir = Path.home() / "project" / project_name / "Log" / self.date_str
+        self.base_dir = Path(home_dir(), "project", project_name, "Log", self.date_str)
         asciinema_dir = self.base_dir / "asciinema"
         zsh_dir = self.base_dir / "zsh"
         tmux_dir = self.base_dir / "tmux"
         video_dir = self.base_dir / "video"
 
-        asciinema_dir.mkdir(parents=True, exist_ok=True)
-        zsh_dir.mkdir(parents=True, exist_ok=True)
-        tmux_dir.mkdir(parents=True, exist_ok=True)
-        video_dir.mkdir(parents=True, exist_ok=True)
-
         self.asciinema_file = asciinema_dir / f"{self.time_str}.cast"
         self.zsh_history_file = zsh_dir / f"{self.time_str}.zsh_history"
         self.tmux_log_dir = tmux_dir
         self.video_dir = video_dir
-        self.video_file = video_dir / f"{project_name}_{self.date_str}_{self.time_str}.mp4"
+        self.video_file = video_dir / f"{'_'.join((project_name, self.date_str, self.time_str))}.mp4"
+
+        # All paths are assembled first, so a failure above leaves nothing on disk
+        _ensure_session_dirs(self.base_dir, (asciinema_dir, zsh_dir, tmux_dir, video_dir))
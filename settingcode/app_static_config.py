@@ -1,9 +1,24 @@
+import os
+from functools import cache
 from pathlib import Path
 from typing import Optional
 from dataclasses import dataclass
 
 
-@dataclass
+@cache
+def home_dir() -> Path:
+    """
+    @brief Resolve the user's home directory once per process.
+
+    Reads $HOME directly and only falls back to the password database
+    lookup behind Path.home() when it is unset.
+
+    @return Home directory path.
+    """
+    return Path(os.environ.get("HOME") or Path.home())
+
+
+@dataclass(slots=True, frozen=True)
 class AppStaticSettings:
     """
     @brief Configuration class for the application.
@@ -25,20 +40,37 @@ class AppStaticSettings:
         @param base_dir Optional base directory path. If None, uses the parent directory of the current file.
         @return AppConfig instance initialized with default paths.
         """
-        if base_dir is None:
-            base_dir = Path(__file__).parent
-
-        settings_dir: Path = base_dir / "settings"
-        tmp_dir: Path = base_dir / "tmp"
-
-        # Ensure temporary directory exists
-        tmp_dir.mkdir(parents=True, exist_ok=True)
-
-        return cls(
-            base_dir=base_dir,
-            settings_dir=settings_dir,
-            tmp_dir=tmp_dir,
-            tmux_dynamic_conf=tmp_dir / "generated_tmux.conf",
-            default_zshrc=Path.home() / ".zshrc",
-            default_tmux_conf=Path.home() / ".tmux.conf"
-        )
+        base_dir = base_dir if base_dir is not None else Path(__file__).parent
+        settings = _defaults_for(cls, str(base_dir))
+
+        # Ensure temporary directory exists; it is removed at the end of every run,
+        # so this can't be part of the cached path computation
+        settings.tmp_dir.mkdir(parents=True, exist_ok=True)
+        return settings
+
+
+@cache
+def _defaults_for(cls: type, base_dir_str: str) -> AppStaticSettings:
+    """
+    @brief Build and cache the default settings for a base directory.
+
+    The settings are frozen, so one instance can be shared by every caller.
+    Only paths are computed here; nothing is created on disk.
+
+    @param cls Settings class to instantiate.
+    @param base_dir_str Base directory as a string, used as the cache key.
+    @return Settings instance initialized with default paths.
+    """
+    base_dir: Path = Path(base_dir_str)
+    home: Path = home_dir()
+    settings_dir: Path = base_dir / "settings"
+    tmp_dir: Path = base_dir / "tmp"
+
+    return cls(
+        base_dir=base_dir,
+        settings_dir=settings_dir,
+        tmp_dir=tmp_dir,
+        tmux_dynamic_conf=tmp_dir / "generated_tmux.conf",
+        default_zshrc=home / ".zshrc",
+        default_tmux_conf=home / ".tmux.conf"
+    )
@@ -1,5 +1,7 @@
+import shutil
 import subprocess
 from pathlib import Path
+from typing import Optional
 
 
 class AsciinemaManager:
@@ -16,30 +18,45 @@ class AsciinemaManager:
         @param output_file Path where the recording will be saved.
         """
         self.output_file = output_file
+        self._process: Optional[subprocess.Popen] = None
 
     def start_recording(self, tmux_session: str) -> None:
         """
         @brief Start asciinema recording of the tmux session.
 
-        Launches asciinema to record the tmux session and save the output
-        to the configured file.
+        Launches asciinema in the background to record the tmux session and save
+        the output to the configured file. Use wait() to block until it ends.
 
         @param tmux_session Name of the tmux session to record.
         @throws RuntimeError If recording fails to start.
         """
 
         # Use asciinema to record the tmux session interaction
-        # This is a blocking call that returns when the session ends
         try:
-            subprocess.run([
-                "asciinema",
+            # An absolute path and close_fds=False let subprocess use posix_spawn
+            self._process = subprocess.Popen([
+                shutil.which("asciinema") or "asciinema",
                 "rec",
                 "-c",
                 f"tmux attach -t {tmux_session}",
                 str(self.output_file)
-            ], check=True, capture_output=True, text=True)
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr if e.stderr else str(e)
-            raise RuntimeError(f"Failed to record with asciinema: {error_msg}") from e
+            ], stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, close_fds=False)
         except Exception as e:
             raise RuntimeError(f"Unexpected error during recording: {e}") from e
+
+    def wait(self) -> None:
+        """
+        @brief Block until asciinema exits.
+
+        asciinema returns when the tmux session ends or the client detaches.
+
+        @throws RuntimeError If asciinema exits with an error.
+        """
+        if self._process is None:
+            return
+
+        _, stderr = self._process.communicate()
+        if self._process.returncode != 0:
+            # stderr is kept as bytes and only decoded when it is reported
+            error_msg = stderr.decode("utf-8", "replace") if stderr else f"exit status {self._process.returncode}"
+            raise RuntimeError(f"Failed to record with asciinema: {error_msg}")
@@ -1,8 +1,26 @@
+import os
+import select
+import shutil
 import subprocess
+from functools import lru_cache
 from pathlib import Path
+from typing import Optional
 import time
 
 
+@lru_cache(maxsize=None)
+def _tmux_executable() -> str:
+    """
+    @brief Resolve the absolute path of tmux once per process.
+
+    subprocess only spawns through posix_spawn (no fork of the interpreter)
+    for an executable with a directory component and close_fds=False.
+
+    @return Absolute path to tmux, or plain "tmux" if it isn't on PATH.
+    """
+    return shutil.which("tmux") or "tmux"
+
+
 class TmuxSessionManager:
     """
     @brief Manages tmux session lifecycle.
@@ -17,6 +35,20 @@ class TmuxSessionManager:
         @param session_name Name of the tmux session to manage.
         """
         self.session_name = tmux_session_name
+        # Socket of the tmux server that hosts the sessions created here; inside
+        # tmux the client talks to the server named in $TMUX, not the default one
+        tmux_env = os.environ.get("TMUX")
+        if tmux_env:
+            self.server_socket = Path(tmux_env.split(",", 1)[0])
+        else:
+            self.server_socket = Path(os.environ.get("TMUX_TMPDIR") or "/tmp") / f"tmux-{os.getuid()}" / "default"
+        # The socket path is a guess until create_session sees it on disk
+        self._socket_confirmed = False
+        self._server_pid: Optional[int] = None
+        # has-session runs on every wait_for_exit poll, so its argv is built once
+        self._has_session_cmd = (_tmux_executable(), "has-session", "-t", self.session_name)
+        # Last known session state; once the session is gone it never comes back by itself
+        self._exists: Optional[bool] = None
 
     def create_session(self, config_path: Path) -> None:
         """
@@ -28,7 +60,7 @@ class TmuxSessionManager:
         try:
             # Create a detached session so we can attach to it with asciinema later
             subprocess.run([
-                "tmux",
+                _tmux_executable(),
                 "-f",
                 str(config_path),
                 "new-session",
@@ -36,44 +68,109 @@ class TmuxSessionManager:
                 "-s",
                 self.session_name,
                 "zsh"
-            ], check=True, capture_output=True, text=True)
+            ], check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, close_fds=False)
         except FileNotFoundError as e:
             raise FileNotFoundError(f"Required configuration file not found: {e}") from e
         except subprocess.CalledProcessError as e:
-            error_msg = e.stderr if e.stderr else str(e)
+            error_msg = e.stderr.decode("utf-8", "replace") if e.stderr else str(e)
             raise RuntimeError(f"Failed to create tmux session: {error_msg}") from e
         except Exception as e:
             raise RuntimeError(f"Unexpected error creating tmux session: {e}") from e
 
+        self._exists = True
+        self._server_pid = self._query_server_pid()
+        # A missing socket right after creation means the guess is wrong and can't be used
+        self._socket_confirmed = self.server_socket.exists()
+
+    def _query_server_pid(self) -> Optional[int]:
+        """
+        @brief Look up the PID of the tmux server hosting the session.
+
+        @return Server PID, or None if it could not be determined.
+        """
+        result = subprocess.run([
+            _tmux_executable(),
+            "display-message",
+            "-p",
+            "-t",
+            self.session_name,
+            "#{pid}"
+        ], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, close_fds=False)
+        try:
+            # int() parses the ASCII digits straight from bytes
+            return int(result.stdout)
+        except ValueError:
+            return None
+
+    def _open_server_pidfd(self) -> Optional[int]:
+        """
+        @brief Open a pidfd for the tmux server, if the platform supports it.
+
+        @return File descriptor that becomes readable when the server exits, or None.
+        """
+        if self._server_pid is None or not hasattr(os, "pidfd_open"):
+            return None
+        try:
+            return os.pidfd_open(self._server_pid)
+        except OSError:
+            return None
+
     def session_exists(self) -> bool:
         """
         @brief Check if the tmux session exists.
 
         @return True if the session exists, False otherwise.
         """
+        # A session seen ended stays ended until create_session runs again
+        if self._exists is False:
+            return False
+
+        # Without the server socket there is no tmux server, so no need to spawn a client.
+        # Only a path seen to exist is trusted, and the answer isn't cached.
+        if self._socket_confirmed and not self.server_socket.exists():
+            return False
+
         # Check if the specified tmux session exists
-        result: subprocess.CompletedProcess = subprocess.run([
-            "tmux",
-            "has-session",
-            "-t",
-            self.session_name
-        ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        returncode: int = subprocess.call(
+            self._has_session_cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, close_fds=False
+        )
 
         # Return code 0 means the session exists
-        return result.returncode == 0
+        self._exists = returncode == 0
+        return self._exists
 
-    def wait_for_exit(self) -> None:
+    def wait_for_exit(self, max_interval: float = 4.0) -> None:
         """
         @brief Wait for the tmux session to terminate.
 
-        Polls the tmux session status at regular intervals until
-        the session no longer exists.
+        Polls the tmux session status until the session no longer exists.
+        The interval starts at one second and doubles up to max_interval.
+        Between checks it waits on a pidfd of the tmux server, so the usual
+        case of the server exiting with its last session is noticed at once.
+        The server may host other sessions, hence the has-session checks.
+
+        @param max_interval Longest delay between two checks, in seconds.
         """
-        # Poll until the session ends to ensure complete recording
-        while True:
-            if not self.session_exists():
-                break
-            time.sleep(1)
+        server_fd = self._open_server_pidfd()
+        poller = None
+        if server_fd is not None:
+            poller = select.poll()
+            poller.register(server_fd, select.POLLIN)
+
+        try:
+            # Poll until the session ends to ensure complete recording
+            interval = 1.0
+            while self.session_exists():
+                if poller is None:
+                    time.sleep(interval)
+                elif poller.poll(interval * 1000):
+                    # The server exited, taking the session with it
+                    self._exists = False
+                    return
+                interval = min(interval * 2, max_interval)
+        finally:
+            if server_fd is not None:
+                os.close(server_fd)
 
     def terminate_session(self) -> bool:
         """
@@ -81,15 +178,18 @@ class TmuxSessionManager:
 
         @return True if the session was terminated, False if it did not exist.
         """
-        if not self.session_exists():
-            return False
-
-        print(f"Terminating tmux session: {self.session_name}")
-        subprocess.run([
-            "tmux",
+        # kill-session fails on a missing session, so it doubles as the existence check.
+        # It always runs: a cached state can be stale, and a session left behind would outlive the tool.
+        returncode: int = subprocess.call([
+            _tmux_executable(),
             "kill-session",
             "-t",
             self.session_name
-        ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=False)
+        ], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, close_fds=False)
+        self._exists = False
+
+        if returncode != 0:
+            return False
 
+        print(f"Terminated tmux session: {self.session_name}")
         return True